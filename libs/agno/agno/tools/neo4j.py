@@ -1,13 +1,168 @@
+import copy
+import functools
+import inspect
 import os
-from typing import Any, List, Optional
-
-try:
-    from neo4j import GraphDatabase
-except ImportError:
-    raise ImportError("`neo4j` not installed. Please install using `pip install neo4j`")
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from agno.tools import Toolkit
-from agno.utils.log import log_debug, logger
+from agno.utils.log import log_debug, log_warning, logger
+
+_DEFAULT_URI = "bolt://localhost:7687"
+
+# Clauses that can modify the graph; queries containing none of them are treated as read-only.
+# CALL is included because procedures and subqueries may write.
+_WRITE_RE = re.compile(r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP|CALL|INSERT)\b", re.IGNORECASE)
+
+# Server error codes for a write sent to a read session; the query is retried in a write session
+_ACCESS_MODE_ERROR_CODES = frozenset({"Neo.ClientError.Statement.AccessMode", "Neo.ClientError.Cluster.NotALeader"})
+
+
+def _is_read_only(query: str) -> bool:
+    return _WRITE_RE.search(query) is None
+
+
+def _is_access_mode_error(error: Exception) -> bool:
+    return getattr(error, "code", None) in _ACCESS_MODE_ERROR_CODES
+
+
+# String literals and escaped names are matched first so that comment markers inside them are kept
+_COMMENT_RE = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)|//[^\n]*|/\*.*?\*/""", re.DOTALL)
+_RETURN_RE = re.compile(r"\bRETURN\b", re.IGNORECASE)
+_UNION_RE = re.compile(r"\bUNION\b", re.IGNORECASE)
+_TRAILING_PAGINATION_RE = re.compile(r"\b(SKIP|LIMIT)\s+(\d+|\$\w+)\s*$", re.IGNORECASE)
+
+
+def _strip_comments(query: str) -> str:
+    return _COMMENT_RE.sub(lambda match: match.group(1) or " ", query)
+
+
+def _ends_with_return(query: str) -> bool:
+    """
+    Whether the last clause of a comment-free query is a top-level RETURN.
+    """
+    returns = list(_RETURN_RE.finditer(query))
+    if not returns:
+        return False
+    tail = query[returns[-1].end() :]
+    # An unmatched closing brace means the last RETURN belongs to a CALL { ... } subquery
+    return tail.count("}") <= tail.count("{")
+
+
+def _paginate(query: str, skip: Optional[int], limit: Optional[int]) -> Tuple[str, Dict[str, int]]:
+    """
+    Append SKIP/LIMIT clauses to a query whose last clause is a RETURN without its own SKIP or LIMIT, returning the
+    query and its parameters. Other queries, including UNION queries, are returned unchanged.
+    """
+    if skip is None and limit is None:
+        return query, {}
+    stripped = _strip_comments(query).rstrip().rstrip(";").rstrip()
+    if not _ends_with_return(stripped) or _UNION_RE.search(stripped) or _TRAILING_PAGINATION_RE.search(stripped):
+        return query, {}
+    clauses = []
+    parameters: Dict[str, int] = {}
+    if skip is not None:
+        clauses.append("SKIP $skip")
+        parameters["skip"] = int(skip)
+    if limit is not None:
+        clauses.append("LIMIT $limit")
+        parameters["limit"] = int(limit)
+    return stripped + " " + " ".join(clauses), parameters
+
+
+# Memoized query results are keyed by the query text and its pagination
+_QueryCacheKey = Tuple[str, Optional[int], Optional[int]]
+
+# Projections for the single column returned by db.labels() and db.relationshipTypes()
+_label = itemgetter("label")
+_relationship_type = itemgetter("relationshipType")
+
+# Fetches everything the schema tools return in a single round-trip, used to prewarm the schema cache
+_PREWARM_SCHEMA_QUERY = (
+    "CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels } "
+    "CALL { CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) AS relationshipTypes } "
+    "CALL db.schema.visualization() YIELD nodes, relationships "
+    "RETURN labels, relationshipTypes, nodes, relationships"
+)
+
+# Drivers shared between toolkits created with share_driver=True, keyed by (uri, user, password, pool size).
+# Each driver maintains its own connection pool, so toolkits for the same server reuse its sockets.
+_SHARED_DRIVERS: Dict[Tuple[Optional[str], str, str, Optional[int]], Any] = {}
+_SHARED_DRIVERS_LOCK = threading.Lock()
+
+
+def _import_neo4j() -> Any:
+    # Imported on first use so that importing this module does not pay for the driver and its dependencies
+    try:
+        import neo4j
+    except ImportError:
+        raise ImportError("`neo4j` not installed. Please install using `pip install neo4j`")
+    return neo4j
+
+
+def _create_driver(neo4j: Any, uri: Optional[str], user: str, password: str, driver_config: Dict[str, Any]) -> Any:
+    driver = neo4j.GraphDatabase.driver(uri, auth=(user, password), **driver_config)
+    driver.verify_connectivity()
+    return driver
+
+
+def _get_shared_driver(neo4j: Any, uri: Optional[str], user: str, password: str, driver_config: Dict[str, Any]) -> Any:
+    key = (uri, user, password, driver_config.get("max_connection_pool_size"))
+    with _SHARED_DRIVERS_LOCK:
+        driver = _SHARED_DRIVERS.get(key)
+    if driver is not None:
+        return driver
+    # Connect outside the lock so that a slow server does not block toolkits connecting to other servers
+    driver = _create_driver(neo4j, uri, user, password, driver_config)
+    with _SHARED_DRIVERS_LOCK:
+        shared = _SHARED_DRIVERS.setdefault(key, driver)
+    if shared is not driver:
+        # Another toolkit connected first; keep its driver and release ours
+        driver.close()
+    return shared
+
+
+def _tool_guard(
+    message: str, default: Callable[[Any], Any] = lambda toolkit: []
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a tool method so that any exception is logged with message and default(toolkit) is returned instead.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"{message}: {e}")
+                    return default(args[0])
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{message}: {e}")
+                return default(args[0])
+
+        return wrapper
+
+    return decorator
+
+
+def _to_columns(keys: Tuple[str, ...], rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    # Transpose the row dictionaries into one list per column, in result key order
+    return {key: list(map(itemgetter(key), rows)) for key in keys}
 
 
 class Neo4jTools(Toolkit):
@@ -22,7 +177,16 @@ class Neo4jTools(Toolkit):
         enable_list_relationships: bool = True,
         enable_get_schema: bool = True,
         enable_run_cypher: bool = True,
+        enable_run_cypher_many: bool = False,
         all: bool = False,
+        schema_cache_ttl: float = 60.0,
+        cache_query_results: bool = False,
+        query_cache_size: int = 256,
+        columnar_results: bool = False,
+        async_mode: bool = False,
+        share_driver: bool = False,
+        max_connection_pool_size: Optional[int] = None,
+        prewarm_schema: bool = False,
         **kwargs,
     ):
         """
@@ -41,94 +205,524 @@ class Neo4jTools(Toolkit):
             list_relationships (bool): Whether to list relationship types.
             get_schema (bool): Whether to get the schema.
             run_cypher (bool): Whether to run Cypher queries.
+            run_cypher_many (bool): Whether to run lists of Cypher queries over a single session.
+            schema_cache_ttl (float): Seconds to cache labels, relationship types and schema. Set to 0 to disable.
+            cache_query_results (bool): Whether to memoize the results of read-only Cypher queries.
+            query_cache_size (int): Maximum number of query results to keep when cache_query_results is enabled.
+            columnar_results (bool): Whether run_cypher_query returns a mapping of column name to values instead of
+                a list of row dictionaries. Values are converted the same way in both layouts.
+            async_mode (bool): Whether to register the async variants of the tools. Only an async driver is created,
+                so the sync methods are unavailable, and share_driver and prewarm_schema have no effect.
+            share_driver (bool): Whether to reuse a process-wide driver, and its connection pool, with other toolkits
+                connecting to the same uri with the same credentials and max_connection_pool_size.
+            max_connection_pool_size (Optional[int]): Maximum number of connections the driver keeps open.
+            prewarm_schema (bool): Whether to fill the schema cache on initialization, so the first schema tool
+                calls are served without a database round-trip.
             **kwargs: Additional keyword arguments.
         """
         # Determine the connection URI and credentials
-        uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        # Environment variables are read on each construction so that values loaded after import (e.g. by dotenv) apply
+        uri = uri or os.getenv("NEO4J_URI", _DEFAULT_URI)
         user = user or os.getenv("NEO4J_USERNAME")
         password = password or os.getenv("NEO4J_PASSWORD")
 
         if user is None or password is None:
             raise ValueError("Username or password for Neo4j not provided")
 
-        # Create the Neo4j driver
+        # Imported before connecting so a missing package is not reported as a connection failure
+        neo4j = _import_neo4j()
+
+        driver_config: Dict[str, Any] = {}
+        if max_connection_pool_size is not None:
+            driver_config["max_connection_pool_size"] = max_connection_pool_size
+
+        # Create the Neo4j driver. In async mode only the async driver is created, since it backs every
+        # registered tool; its connectivity is verified on first use because __init__ cannot await.
+        self.driver: Optional[Any] = None
+        self.async_driver: Optional[Any] = None
+        self._async_verified = False
         try:
-            self.driver = GraphDatabase.driver(uri, auth=(user, password))  # type: ignore
-            self.driver.verify_connectivity()
-            log_debug("Connected to Neo4j database")
+            if async_mode:
+                if share_driver:
+                    log_warning("Ignoring share_driver because it is not supported with async_mode=True")
+                self.async_driver = neo4j.AsyncGraphDatabase.driver(uri, auth=(user, password), **driver_config)
+                log_debug("Created async Neo4j driver")
+            elif share_driver:
+                self.driver = _get_shared_driver(neo4j, uri, user, password, driver_config)
+                log_debug("Connected to Neo4j database")
+            else:
+                self.driver = _create_driver(neo4j, uri, user, password, driver_config)
+                log_debug("Connected to Neo4j database")
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
             raise
 
         self.database = database or "neo4j"
+        # Sessions are not thread-safe and must stay short-lived, but their configuration
+        # is fixed for the lifetime of the toolkit, so it is built once here.
+        self._session_config: Dict[str, Any] = {"database": self.database}
+        # Read sessions let a cluster route queries to followers and read replicas
+        self._read_session_config: Dict[str, Any] = {
+            **self._session_config,
+            "default_access_mode": neo4j.READ_ACCESS,
+        }
+
+        # Schema introspection results, keyed by method name and stored with the time they were fetched
+        self.schema_cache_ttl = schema_cache_ttl
+        self._schema_cache: Dict[str, Tuple[float, Any]] = {}
+
+        # Least-recently-used cache of read-only query results, keyed by query text and pagination
+        self.cache_query_results = cache_query_results
+        self.query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[_QueryCacheKey, Union[list, dict]]" = OrderedDict()
+        self.columnar_results = columnar_results
+
+        if prewarm_schema:
+            self._prewarm_schema_cache()
 
         # Register toolkit methods as tools
+        self.async_mode = async_mode
         tools: List[Any] = []
         if all or enable_list_labels:
-            tools.append(self.list_labels)
+            tools.append(self.alist_labels if async_mode else self.list_labels)
         if all or enable_list_relationships:
-            tools.append(self.list_relationship_types)
+            tools.append(self.alist_relationship_types if async_mode else self.list_relationship_types)
         if all or enable_get_schema:
-            tools.append(self.get_schema)
+            tools.append(self.aget_schema if async_mode else self.get_schema)
         if all or enable_run_cypher:
-            tools.append(self.run_cypher_query)
+            tools.append(self.arun_cypher_query if async_mode else self.run_cypher_query)
+        if all or enable_run_cypher_many:
+            tools.append(self.arun_cypher_many if async_mode else self.run_cypher_many)
         super().__init__(name="neo4j_tools", tools=tools, **kwargs)
 
-    def list_labels(self) -> list:
+    def _session(self, read_only: bool = False):
         """
-        Retrieve all node labels present in the connected Neo4j database.
+        Open a new session against the configured database.
+        """
+        if self.driver is None:
+            raise RuntimeError("Sync tools are unavailable when Neo4jTools is created with async_mode=True")
+        return self.driver.session(**(self._read_session_config if read_only else self._session_config))
+
+    @asynccontextmanager
+    async def _async_session(self, read_only: bool = False) -> AsyncIterator[Any]:
+        """
+        Open a new async session against the configured database, verifying connectivity on first use.
         """
+        if self.async_driver is None:
+            raise RuntimeError("Async tools require Neo4jTools to be created with async_mode=True")
+        if not self._async_verified:
+            await self.async_driver.verify_connectivity()
+            self._async_verified = True
+            log_debug("Connected to Neo4j database")
+        async with self.async_driver.session(
+            **(self._read_session_config if read_only else self._session_config)
+        ) as session:
+            yield session
+
+    def _get_cached_schema(self, key: str) -> Optional[Any]:
+        entry = self._schema_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.schema_cache_ttl:
+            # Hand out a copy so callers mutating the result cannot corrupt the cached entry
+            return copy.deepcopy(entry[1])
+        return None
+
+    def _set_cached_schema(self, key: str, value: Any) -> None:
+        if self.schema_cache_ttl > 0:
+            self._schema_cache[key] = (time.monotonic(), copy.deepcopy(value))
+
+    def _cached(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key if it is younger than the schema cache TTL, otherwise fetch and store it.
+        """
+        value = self._get_cached_schema(key)
+        if value is None:
+            value = fetch()
+            self._set_cached_schema(key, value)
+        return value
+
+    async def _acached(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of _cached.
+        """
+        value = self._get_cached_schema(key)
+        if value is None:
+            value = await fetch()
+            self._set_cached_schema(key, value)
+        return value
+
+    def invalidate_schema_cache(self) -> None:
+        """
+        Drop all cached schema introspection results, e.g. after changing the graph's labels or relationship types.
+        """
+        self._schema_cache.clear()
+
+    def clear_query_cache(self) -> None:
+        """
+        Drop all memoized Cypher query results.
+        """
+        self._query_cache.clear()
+
+    def _prewarm_schema_cache(self) -> None:
+        if self.schema_cache_ttl <= 0:
+            log_warning("Skipping Neo4j schema prewarm because the schema cache is disabled")
+            return
+        if self.driver is None:
+            log_warning("Skipping Neo4j schema prewarm because it is not supported with async_mode=True")
+            return
         try:
-            log_debug("Listing node labels in Neo4j database")
-            with self.driver.session(database=self.database) as session:
-                result = session.run("CALL db.labels()")
-                labels = [record["label"] for record in result]
-            return labels
+            log_debug("Prewarming Neo4j schema cache")
+            with self._session(read_only=True) as session:
+                record = session.run(_PREWARM_SCHEMA_QUERY).single()
+                if record is None:
+                    return
+                self._set_cached_schema("labels", record["labels"])
+                self._set_cached_schema("relationship_types", record["relationshipTypes"])
+                self._set_cached_schema("schema", record.data("nodes", "relationships"))
         except Exception as e:
-            logger.error(f"Error listing labels: {e}")
-            return []
+            log_warning(f"Failed to prewarm Neo4j schema cache: {e}")
+
+    def _fetch_labels(self) -> list:
+        with self._session(read_only=True) as session:
+            result = session.run("CALL db.labels()")
+            return list(map(_label, result))
 
+    def _fetch_relationship_types(self) -> list:
+        with self._session(read_only=True) as session:
+            result = session.run("CALL db.relationshipTypes()")
+            return list(map(_relationship_type, result))
+
+    def _fetch_schema(self) -> dict:
+        with self._session(read_only=True) as session:
+            record = session.run("CALL db.schema.visualization()").single()
+            return record.data() if record is not None else {}
+
+    def _empty_query_result(self) -> Union[list, dict]:
+        return {} if self.columnar_results else []
+
+    def _read_result(self, result: Any) -> Union[list, dict]:
+        if self.columnar_results:
+            return _to_columns(result.keys(), result.data())
+        return result.data()
+
+    async def _aread_result(self, result: Any) -> Union[list, dict]:
+        if self.columnar_results:
+            return _to_columns(result.keys(), await result.data())
+        return await result.data()
+
+    def _fetch_query(
+        self, query: str, read_only: bool = False, parameters: Optional[Dict[str, Any]] = None
+    ) -> Union[list, dict]:
+        with self._session(read_only=read_only) as session:
+            return self._read_result(session.run(query, **(parameters or {})))  # type: ignore[arg-type]
+
+    def _write_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Union[list, dict]:
+        try:
+            return self._fetch_query(query, parameters=parameters)
+        finally:
+            # The write may have changed anything read so far
+            self.clear_query_cache()
+            self.invalidate_schema_cache()
+
+    async def _afetch_labels(self) -> list:
+        async with self._async_session(read_only=True) as session:
+            result = await session.run("CALL db.labels()")
+            return [record["label"] async for record in result]
+
+    async def _afetch_relationship_types(self) -> list:
+        async with self._async_session(read_only=True) as session:
+            result = await session.run("CALL db.relationshipTypes()")
+            return [record["relationshipType"] async for record in result]
+
+    async def _afetch_schema(self) -> dict:
+        async with self._async_session(read_only=True) as session:
+            result = await session.run("CALL db.schema.visualization()")
+            record = await result.single()
+            return record.data() if record is not None else {}
+
+    async def _afetch_query(
+        self, query: str, read_only: bool = False, parameters: Optional[Dict[str, Any]] = None
+    ) -> Union[list, dict]:
+        async with self._async_session(read_only=read_only) as session:
+            return await self._aread_result(await session.run(query, **(parameters or {})))  # type: ignore[arg-type]
+
+    async def _awrite_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Union[list, dict]:
+        try:
+            return await self._afetch_query(query, parameters=parameters)
+        finally:
+            # The write may have changed anything read so far
+            self.clear_query_cache()
+            self.invalidate_schema_cache()
+
+    def _get_cached_query(self, key: _QueryCacheKey) -> Optional[Union[list, dict]]:
+        cache = self._query_cache
+        data = cache.get(key)
+        if data is None:
+            return None
+        try:
+            cache.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread since the lookup; the copy below is still valid
+            pass
+        # Hand out a copy so callers mutating the result cannot corrupt the cached entry
+        return copy.deepcopy(data)
+
+    def _set_cached_query(self, key: _QueryCacheKey, data: Union[list, dict]) -> None:
+        cache = self._query_cache
+        cache[key] = copy.deepcopy(data)
+        while len(cache) > self.query_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+
+    @_tool_guard("Error listing labels")
+    def list_labels(self) -> list:
+        """
+        Retrieve all node labels present in the connected Neo4j database.
+        """
+        log_debug("Listing node labels in Neo4j database")
+        return self._cached("labels", self._fetch_labels)
+
+    @_tool_guard("Error listing relationship types")
     def list_relationship_types(self) -> list:
         """
         Retrieve all relationship types present in the connected Neo4j database.
         """
+        log_debug("Listing relationship types in Neo4j database")
+        return self._cached("relationship_types", self._fetch_relationship_types)
+
+    @_tool_guard("Error getting Neo4j schema", default=lambda toolkit: {})
+    def get_schema(self) -> dict:
+        """
+        Retrieve a visualization of the database schema as a dictionary with "nodes" and "relationships" keys.
+        """
+        log_debug("Retrieving Neo4j schema visualization")
+        return self._cached("schema", self._fetch_schema)
+
+    @_tool_guard("Error running Cypher query", default=lambda toolkit: toolkit._empty_query_result())
+    def run_cypher_query(
+        self, query: str, limit: Optional[int] = None, skip: Optional[int] = None
+    ) -> Union[list, dict]:
+        """
+        Execute an arbitrary Cypher query against the connected Neo4j database.
+
+        Args:
+            query (str): The Cypher query string to execute.
+            limit (Optional[int]): Maximum number of rows to return. Only applied when the query ends with a RETURN
+                clause that has no SKIP or LIMIT of its own; ignored for UNION queries.
+            skip (Optional[int]): Number of rows to skip before returning results. Applied under the same conditions
+                as limit.
+        """
+        log_debug(f"Running Cypher query: {query}")
+        paginated_query, parameters = _paginate(query, skip, limit)
+        if not _is_read_only(query):
+            return self._write_query(paginated_query, parameters)
+        key = (query, skip, limit)
+        if self.cache_query_results:
+            data = self._get_cached_query(key)
+            if data is not None:
+                return data
         try:
-            log_debug("Listing relationship types in Neo4j database")
-            with self.driver.session(database=self.database) as session:
-                result = session.run("CALL db.relationshipTypes()")
-                types = [record["relationshipType"] for record in result]
-            return types
+            data = self._fetch_query(paginated_query, read_only=True, parameters=parameters)
         except Exception as e:
-            logger.error(f"Error listing relationship types: {e}")
-            return []
+            if not _is_access_mode_error(e):
+                raise
+            log_debug("Cypher query was rejected by a read session, retrying in a write session")
+            return self._write_query(paginated_query, parameters)
+        if self.cache_query_results:
+            self._set_cached_query(key, data)
+        return data
 
-    def get_schema(self) -> list:
+    def iter_cypher_query(self, query: str) -> Iterator[Dict[str, Any]]:
         """
-        Retrieve a visualization of the database schema, including nodes and relationships.
+        Execute a Cypher query and yield its records one at a time, without materializing the whole result.
+        The session stays open until the generator is exhausted or closed.
+
+        Args:
+            query (str): The Cypher query string to execute.
+
+        Yields:
+            Dict[str, Any]: Each record as a dictionary, converted like the rows of run_cypher_query.
         """
+        log_debug(f"Streaming Cypher query: {query}")
+        read_only = _is_read_only(query)
+        yielded = False
         try:
-            log_debug("Retrieving Neo4j schema visualization")
-            with self.driver.session(database=self.database) as session:
-                result = session.run("CALL db.schema.visualization()")
-                schema_data = result.data()
-            return schema_data
+            try:
+                with self._session(read_only=read_only) as session:
+                    for record in session.run(query):  # type: ignore[arg-type]
+                        yielded = True
+                        yield record.data()
+            except Exception as e:
+                # Records already yielded cannot be taken back, so only a query that failed upfront is retried
+                if not read_only or yielded or not _is_access_mode_error(e):
+                    raise
+                log_debug("Cypher query was rejected by a read session, retrying in a write session")
+                read_only = False
+                with self._session() as session:
+                    for record in session.run(query):  # type: ignore[arg-type]
+                        yield record.data()
         except Exception as e:
-            logger.error(f"Error getting Neo4j schema: {e}")
+            logger.error(f"Error streaming Cypher query: {e}")
+            raise
+        finally:
+            if not read_only:
+                # The write may have changed anything read so far
+                self.clear_query_cache()
+                self.invalidate_schema_cache()
+
+    def run_cypher_many(self, queries: List[str]) -> List[Union[list, dict]]:
+        """
+        Execute several independent Cypher queries against the connected Neo4j database, one after another.
+        The queries share one session, which saves a session checkout per query, but each one is still its own
+        auto-commit query and database round-trip.
+
+        Args:
+            queries (List[str]): The Cypher query strings to execute, in order.
+
+        Returns:
+            List[Union[list, dict]]: The result of each query, in the same order. Failed queries return an empty result.
+        """
+        if not queries:
             return []
+        results: List[Union[list, dict]] = []
+        read_only = all(_is_read_only(query) for query in queries)
+        rejected: List[int] = []
+        try:
+            log_debug(f"Running {len(queries)} Cypher queries")
+            with self._session(read_only=read_only) as session:
+                for query in queries:
+                    try:
+                        results.append(self._read_result(session.run(query)))  # type: ignore[arg-type]
+                    except Exception as e:
+                        if read_only and _is_access_mode_error(e):
+                            rejected.append(len(results))
+                        else:
+                            logger.error(f"Error running Cypher query: {e}")
+                        results.append(self._empty_query_result())
+            if rejected:
+                log_debug(
+                    f"{len(rejected)} Cypher queries were rejected by a read session, retrying in a write session"
+                )
+                read_only = False
+                with self._session() as session:
+                    for index in rejected:
+                        try:
+                            results[index] = self._read_result(session.run(queries[index]))  # type: ignore[arg-type]
+                        except Exception as e:
+                            logger.error(f"Error running Cypher query: {e}")
+        except Exception as e:
+            logger.error(f"Error running Cypher queries: {e}")
+        finally:
+            if not read_only:
+                # A write may have changed anything read so far
+                self.clear_query_cache()
+                self.invalidate_schema_cache()
+        return results + [self._empty_query_result() for _ in range(len(queries) - len(results))]
+
+    @_tool_guard("Error listing labels")
+    async def alist_labels(self) -> list:
+        """
+        Retrieve all node labels present in the connected Neo4j database.
+        """
+        log_debug("Listing node labels in Neo4j database")
+        return await self._acached("labels", self._afetch_labels)
+
+    @_tool_guard("Error listing relationship types")
+    async def alist_relationship_types(self) -> list:
+        """
+        Retrieve all relationship types present in the connected Neo4j database.
+        """
+        log_debug("Listing relationship types in Neo4j database")
+        return await self._acached("relationship_types", self._afetch_relationship_types)
+
+    @_tool_guard("Error getting Neo4j schema", default=lambda toolkit: {})
+    async def aget_schema(self) -> dict:
+        """
+        Retrieve a visualization of the database schema as a dictionary with "nodes" and "relationships" keys.
+        """
+        log_debug("Retrieving Neo4j schema visualization")
+        return await self._acached("schema", self._afetch_schema)
 
-    def run_cypher_query(self, query: str) -> list:
+    @_tool_guard("Error running Cypher query", default=lambda toolkit: toolkit._empty_query_result())
+    async def arun_cypher_query(
+        self, query: str, limit: Optional[int] = None, skip: Optional[int] = None
+    ) -> Union[list, dict]:
         """
         Execute an arbitrary Cypher query against the connected Neo4j database.
 
         Args:
             query (str): The Cypher query string to execute.
+            limit (Optional[int]): Maximum number of rows to return. Only applied when the query ends with a RETURN
+                clause that has no SKIP or LIMIT of its own; ignored for UNION queries.
+            skip (Optional[int]): Number of rows to skip before returning results. Applied under the same conditions
+                as limit.
         """
+        log_debug(f"Running Cypher query: {query}")
+        paginated_query, parameters = _paginate(query, skip, limit)
+        if not _is_read_only(query):
+            return await self._awrite_query(paginated_query, parameters)
+        key = (query, skip, limit)
+        if self.cache_query_results:
+            data = self._get_cached_query(key)
+            if data is not None:
+                return data
         try:
-            log_debug(f"Running Cypher query: {query}")
-            with self.driver.session(database=self.database) as session:
-                result = session.run(query)  # type: ignore[arg-type]
-                data = result.data()
-            return data
+            data = await self._afetch_query(paginated_query, read_only=True, parameters=parameters)
         except Exception as e:
-            logger.error(f"Error running Cypher query: {e}")
+            if not _is_access_mode_error(e):
+                raise
+            log_debug("Cypher query was rejected by a read session, retrying in a write session")
+            return await self._awrite_query(paginated_query, parameters)
+        if self.cache_query_results:
+            self._set_cached_query(key, data)
+        return data
+
+    async def arun_cypher_many(self, queries: List[str]) -> List[Union[list, dict]]:
+        """
+        Execute several independent Cypher queries against the connected Neo4j database, one after another.
+        The queries share one session, which saves a session checkout per query, but each one is still its own
+        auto-commit query and database round-trip.
+
+        Args:
+            queries (List[str]): The Cypher query strings to execute, in order.
+
+        Returns:
+            List[Union[list, dict]]: The result of each query, in the same order. Failed queries return an empty result.
+        """
+        if not queries:
             return []
+        results: List[Union[list, dict]] = []
+        read_only = all(_is_read_only(query) for query in queries)
+        rejected: List[int] = []
+        try:
+            log_debug(f"Running {len(queries)} Cypher queries")
+            async with self._async_session(read_only=read_only) as session:
+                for query in queries:
+                    try:
+                        results.append(await self._aread_result(await session.run(query)))  # type: ignore[arg-type]
+                    except Exception as e:
+                        if read_only and _is_access_mode_error(e):
+                            rejected.append(len(results))
+                        else:
+                            logger.error(f"Error running Cypher query: {e}")
+                        results.append(self._empty_query_result())
+            if rejected:
+                log_debug(
+                    f"{len(rejected)} Cypher queries were rejected by a read session, retrying in a write session"
+                )
+                read_only = False
+                async with self._async_session() as session:
+                    for index in rejected:
+                        try:
+                            results[index] = await self._aread_result(await session.run(queries[index]))  # type: ignore[arg-type]
+                        except Exception as e:
+                            logger.error(f"Error running Cypher query: {e}")
+        except Exception as e:
+            logger.error(f"Error running Cypher queries: {e}")
+        finally:
+            if not read_only:
+                # A write may have changed anything read so far
+                self.clear_query_cache()
+                self.invalidate_schema_cache()
+        return results + [self._empty_query_result() for _ in range(len(queries) - len(results))]
@@ -1,9 +1,10 @@
 import os
-from unittest.mock import MagicMock, patch
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from agno.tools.neo4j import Neo4jTools
+from agno.tools.neo4j import _SHARED_DRIVERS_LOCK, Neo4jTools, _import_neo4j
 
 
 def test_list_labels():
@@ -67,18 +68,18 @@ def test_get_schema():
     with patch("neo4j.GraphDatabase.driver") as mock_driver:
         mock_session = mock_driver.return_value.session.return_value
         mock_session.__enter__.return_value = mock_session
-        mock_result = MagicMock()
-        mock_result.data.return_value = [
-            {"nodes": [{"id": 1, "labels": ["Person"]}], "relationships": [{"id": 1, "type": "ACTED_IN"}]}
-        ]
-        mock_session.run.return_value = mock_result
+        mock_record = mock_session.run.return_value.single.return_value
+        mock_record.data.return_value = {
+            "nodes": [{"id": 1, "labels": ["Person"]}],
+            "relationships": [{"id": 1, "type": "ACTED_IN"}],
+        }
 
         tools = Neo4jTools("uri", "user", "password")
         schema = tools.get_schema()
-        assert len(schema) == 1
-        assert "nodes" in schema[0]
-        assert "relationships" in schema[0]
-        mock_session.run.assert_called_with("CALL db.schema.visualization()")
+        assert schema["nodes"] == [{"id": 1, "labels": ["Person"]}]
+        assert schema["relationships"] == [{"id": 1, "type": "ACTED_IN"}]
+        # Nodes and relationships are fetched together in a single round-trip
+        mock_session.run.assert_called_once_with("CALL db.schema.visualization()")
 
 
 def test_get_schema_error():
@@ -89,7 +90,7 @@ def test_get_schema_error():
 
         tools = Neo4jTools("uri", "user", "password")
         schema = tools.get_schema()
-        assert schema == []
+        assert schema == {}
 
 
 def test_run_cypher_query():
@@ -133,6 +134,15 @@ def test_initialization_with_env_vars():
         mock_driver.assert_called_with("bolt://test-host:7687", auth=("test_user", "test_pass"))
 
 
+def test_initialization_default_uri():
+    with (
+        patch("neo4j.GraphDatabase.driver") as mock_driver,
+        patch.dict(os.environ, {"NEO4J_USERNAME": "test_user", "NEO4J_PASSWORD": "test_pass"}, clear=True),
+    ):
+        Neo4jTools()
+        mock_driver.assert_called_with("bolt://localhost:7687", auth=("test_user", "test_pass"))
+
+
 def test_initialization_missing_credentials():
     with patch("neo4j.GraphDatabase.driver"), patch.dict(os.environ, {}, clear=True):
         with pytest.raises(ValueError, match="Username or password for Neo4j not provided"):
@@ -178,3 +188,653 @@ def test_driver_connectivity_verification():
 
         with pytest.raises(Exception, match="Connection failed"):
             Neo4jTools("uri", "user", "password")
+
+
+def test_session_uses_configured_database():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.return_value = [{"label": "Person"}]
+
+        tools = Neo4jTools("uri", "user", "password", database="custom_db")
+        tools.list_labels()
+        tools.list_relationship_types()
+        for call in mock_driver.return_value.session.call_args_list:
+            assert call.kwargs == {"database": "custom_db", "default_access_mode": "READ"}
+
+
+def test_schema_cache_serves_repeated_calls():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.return_value = [{"label": "Person"}, {"label": "Movie"}]
+
+        tools = Neo4jTools("uri", "user", "password")
+        assert tools.list_labels() == ["Person", "Movie"]
+        assert tools.list_labels() == ["Person", "Movie"]
+        assert mock_session.run.call_count == 1
+
+        tools.invalidate_schema_cache()
+        tools.list_labels()
+        assert mock_session.run.call_count == 2
+
+
+def test_schema_cache_returns_copies():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_record = mock_session.run.return_value = MagicMock()
+        mock_record.__iter__.side_effect = lambda: iter([{"label": "Person"}])
+        mock_record.single.return_value.data.return_value = {"nodes": [{"id": 1}], "relationships": []}
+
+        tools = Neo4jTools("uri", "user", "password")
+        tools.list_labels().append("JUNK")
+        tools.list_labels().append("JUNK")
+        assert tools.list_labels() == ["Person"]
+
+        tools.get_schema()["nodes"].append({"id": 2})
+        tools.get_schema()["nodes"].append({"id": 2})
+        assert tools.get_schema() == {"nodes": [{"id": 1}], "relationships": []}
+        assert mock_session.run.call_count == 2
+
+
+def test_schema_cache_expires_and_can_be_disabled():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver, patch("agno.tools.neo4j.time.monotonic") as mock_time:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.return_value = [{"relationshipType": "ACTED_IN"}]
+
+        mock_time.return_value = 100.0
+        tools = Neo4jTools("uri", "user", "password", schema_cache_ttl=10)
+        tools.list_relationship_types()
+        mock_time.return_value = 111.0
+        tools.list_relationship_types()
+        assert mock_session.run.call_count == 2
+
+        uncached = Neo4jTools("uri", "user", "password", schema_cache_ttl=0)
+        uncached.list_relationship_types()
+        uncached.list_relationship_types()
+        assert mock_session.run.call_count == 4
+
+
+def test_schema_cache_skips_failed_queries():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.side_effect = [Exception("Query failed"), [{"label": "Person"}]]
+
+        tools = Neo4jTools("uri", "user", "password")
+        assert tools.list_labels() == []
+        assert tools.list_labels() == ["Person"]
+
+
+def test_run_cypher_query_cache():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_result = MagicMock()
+        mock_result.data.return_value = [{"name": "John"}]
+        mock_session.run.return_value = mock_result
+
+        tools = Neo4jTools("uri", "user", "password", cache_query_results=True)
+        query = "MATCH (p:Person) RETURN p.name as name"
+        assert tools.run_cypher_query(query) == [{"name": "John"}]
+        assert tools.run_cypher_query(query) == [{"name": "John"}]
+        assert mock_session.run.call_count == 1
+
+        # Writes always reach the database and invalidate cached reads
+        tools.run_cypher_query("CREATE (:Person {name: 'Jane'})")
+        tools.run_cypher_query("CREATE (:Person {name: 'Jane'})")
+        assert mock_session.run.call_count == 3
+        tools.run_cypher_query(query)
+        assert mock_session.run.call_count == 4
+
+
+def test_run_cypher_query_cache_evicts_least_recently_used():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password", cache_query_results=True, query_cache_size=2)
+        tools.run_cypher_query("MATCH (n) RETURN 1")
+        tools.run_cypher_query("MATCH (n) RETURN 2")
+        tools.run_cypher_query("MATCH (n) RETURN 1")
+        tools.run_cypher_query("MATCH (n) RETURN 3")
+        assert list(tools._query_cache) == [("MATCH (n) RETURN 1", None, None), ("MATCH (n) RETURN 3", None, None)]
+
+        tools.clear_query_cache()
+        assert not tools._query_cache
+
+
+def test_run_cypher_query_cache_returns_copies():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.return_value.data.side_effect = lambda: [{"a": 1}]
+
+        tools = Neo4jTools("uri", "user", "password", cache_query_results=True)
+        query = "MATCH (n) RETURN 1 AS a"
+        first = tools.run_cypher_query(query)
+        first.append("junk")
+        first[0]["a"] = 2
+
+        assert tools.run_cypher_query(query) == [{"a": 1}]
+        second = tools.run_cypher_query(query)
+        second.append("junk")
+        assert tools.run_cypher_query(query) == [{"a": 1}]
+        assert mock_session.run.call_count == 1
+
+
+def test_run_cypher_query_cache_tolerates_concurrent_eviction():
+    with patch("neo4j.GraphDatabase.driver"):
+        tools = Neo4jTools("uri", "user", "password", cache_query_results=True)
+        key = ("MATCH (n) RETURN n", None, None)
+        tools._set_cached_query(key, [{"n": 1}])
+
+        # Simulate another thread evicting the key between the lookup and move_to_end
+        with patch.object(tools._query_cache, "move_to_end", side_effect=KeyError(key)):
+            assert tools._get_cached_query(key) == [{"n": 1}]
+
+
+def test_run_cypher_query_not_cached_by_default():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password")
+        tools.run_cypher_query("MATCH (n) RETURN n")
+        tools.run_cypher_query("MATCH (n) RETURN n")
+        assert mock_session.run.call_count == 2
+
+
+def test_run_cypher_query_columnar():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_result = MagicMock()
+        mock_result.keys.return_value = ("name", "person")
+        # Values come from Result.data(), so nodes are converted exactly as in row mode
+        mock_result.data.return_value = [
+            {"name": "John", "person": {"name": "John", "age": 30}},
+            {"name": "Jane", "person": {"name": "Jane", "age": 25}},
+        ]
+        mock_session.run.return_value = mock_result
+
+        tools = Neo4jTools("uri", "user", "password", columnar_results=True)
+        result = tools.run_cypher_query("MATCH (p:Person) RETURN p.name as name, p as person")
+        assert result == {
+            "name": ["John", "Jane"],
+            "person": [{"name": "John", "age": 30}, {"name": "Jane", "age": 25}],
+        }
+        mock_result.values.assert_not_called()
+
+        mock_result.data.return_value = []
+        result = tools.run_cypher_query("MATCH (p:Robot) RETURN p.name as name, p as person")
+        assert result == {"name": [], "person": []}
+
+
+def test_run_cypher_query_columnar_error():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.side_effect = Exception("Cypher query failed")
+
+        tools = Neo4jTools("uri", "user", "password", columnar_results=True)
+        assert tools.run_cypher_query("INVALID QUERY") == {}
+        assert tools.run_cypher_many(["INVALID QUERY"]) == [{}]
+
+
+def _mock_async_session(mock_async_driver):
+    mock_async_driver.return_value.verify_connectivity = AsyncMock()
+    mock_session = mock_async_driver.return_value.session.return_value
+    mock_session.__aenter__.return_value = mock_session
+    mock_session.run = AsyncMock()
+    return mock_session
+
+
+def test_async_mode_registers_async_tools():
+    with (
+        patch("neo4j.GraphDatabase.driver") as mock_driver,
+        patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver,
+    ):
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+
+        tool_names = [tool.__name__ for tool in tools.tools]
+        assert tool_names == ["alist_labels", "alist_relationship_types", "aget_schema", "arun_cypher_query"]
+        mock_async_driver.assert_called_with("uri", auth=("user", "password"))
+        # Only the async driver backs the registered tools, so no sync pool is opened
+        mock_driver.assert_not_called()
+        assert tools.driver is None
+        assert tools.list_labels() == []
+
+
+def test_async_mode_warns_share_driver_ignored():
+    with (
+        patch("neo4j.GraphDatabase.driver") as mock_driver,
+        patch("neo4j.AsyncGraphDatabase.driver"),
+        patch("agno.tools.neo4j.log_warning") as mock_log_warning,
+    ):
+        tools = Neo4jTools("uri", "user", "password", async_mode=True, share_driver=True)
+
+        mock_log_warning.assert_called_once_with(
+            "Ignoring share_driver because it is not supported with async_mode=True"
+        )
+        mock_driver.assert_not_called()
+        assert tools.async_driver is not None
+
+
+async def test_async_mode_verifies_connectivity_once():
+    with patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        mock_session = _mock_async_session(mock_async_driver)
+        mock_session.run.return_value.data = AsyncMock(return_value=[])
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+        mock_async_driver.return_value.verify_connectivity.assert_not_awaited()
+        await tools.arun_cypher_query("MATCH (n) RETURN n")
+        await tools.arun_cypher_query("MATCH (n) RETURN n")
+        mock_async_driver.return_value.verify_connectivity.assert_awaited_once()
+
+
+async def test_async_mode_connectivity_failure():
+    with patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        _mock_async_session(mock_async_driver)
+        mock_async_driver.return_value.verify_connectivity.side_effect = Exception("Connection refused")
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+        assert await tools.alist_labels() == []
+        mock_async_driver.return_value.session.assert_not_called()
+
+
+async def test_alist_labels():
+    with patch("neo4j.GraphDatabase.driver"), patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        mock_session = _mock_async_session(mock_async_driver)
+        mock_result = MagicMock()
+        mock_result.__aiter__.return_value = [{"label": "Person"}, {"label": "Movie"}]
+        mock_session.run.return_value = mock_result
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+        assert await tools.alist_labels() == ["Person", "Movie"]
+        assert await tools.alist_labels() == ["Person", "Movie"]
+        mock_session.run.assert_awaited_once_with("CALL db.labels()")
+
+
+async def test_arun_cypher_query():
+    with patch("neo4j.GraphDatabase.driver"), patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        mock_session = _mock_async_session(mock_async_driver)
+        mock_result = MagicMock()
+        mock_result.data = AsyncMock(return_value=[{"name": "John", "age": 30}])
+        mock_session.run.return_value = mock_result
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+        query = "MATCH (p:Person) RETURN p.name as name, p.age as age"
+        assert await tools.arun_cypher_query(query) == [{"name": "John", "age": 30}]
+        mock_session.run.assert_awaited_with(query)
+
+
+async def test_arun_cypher_query_error():
+    with patch("neo4j.GraphDatabase.driver"), patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        mock_session = _mock_async_session(mock_async_driver)
+        mock_session.run.side_effect = Exception("Cypher query failed")
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+        assert await tools.arun_cypher_query("INVALID QUERY") == []
+
+
+async def test_async_tools_require_async_mode():
+    with patch("neo4j.GraphDatabase.driver"):
+        tools = Neo4jTools("uri", "user", "password")
+        assert await tools.alist_labels() == []
+
+
+def test_share_driver_reuses_driver():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver, patch.dict("agno.tools.neo4j._SHARED_DRIVERS", clear=True):
+        first = Neo4jTools("uri", "user", "password", share_driver=True)
+        second = Neo4jTools("uri", "user", "password", database="other", share_driver=True)
+        other_user = Neo4jTools("uri", "other_user", "password", share_driver=True)
+
+        assert first.driver is second.driver
+        assert mock_driver.call_count == 2
+        assert mock_driver.return_value.verify_connectivity.call_count == 2
+        assert other_user.driver is mock_driver.return_value
+        assert second.database == "other"
+
+
+def test_share_driver_keys_on_pool_size():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver, patch.dict("agno.tools.neo4j._SHARED_DRIVERS", clear=True):
+        mock_driver.side_effect = lambda *args, **kwargs: MagicMock()
+        default_pool = Neo4jTools("uri", "user", "password", share_driver=True)
+        small_pool = Neo4jTools("uri", "user", "password", share_driver=True, max_connection_pool_size=5)
+        small_pool_again = Neo4jTools("uri", "user", "password", share_driver=True, max_connection_pool_size=5)
+
+        assert default_pool.driver is not small_pool.driver
+        assert small_pool.driver is small_pool_again.driver
+        mock_driver.assert_called_with("uri", auth=("user", "password"), max_connection_pool_size=5)
+
+
+def test_share_driver_connects_outside_lock():
+    with (
+        patch("neo4j.GraphDatabase.driver") as mock_driver,
+        patch.dict("agno.tools.neo4j._SHARED_DRIVERS", clear=True) as shared_drivers,
+    ):
+        winner = MagicMock()
+
+        def connect_while_another_toolkit_wins(*args, **kwargs):
+            # The lock is free while connecting, and another toolkit stores its driver first
+            assert _SHARED_DRIVERS_LOCK.acquire(blocking=False)
+            _SHARED_DRIVERS_LOCK.release()
+            shared_drivers[("uri", "user", "password", None)] = winner
+            return loser
+
+        loser = MagicMock()
+        mock_driver.side_effect = connect_while_another_toolkit_wins
+
+        tools = Neo4jTools("uri", "user", "password", share_driver=True)
+        assert tools.driver is winner
+        loser.close.assert_called_once()
+
+
+def test_max_connection_pool_size():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        Neo4jTools("uri", "user", "password", max_connection_pool_size=5)
+        mock_driver.assert_called_with("uri", auth=("user", "password"), max_connection_pool_size=5)
+
+
+def test_prewarm_schema():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        record = MagicMock()
+        record.__getitem__.side_effect = {"labels": ["Person"], "relationshipTypes": ["ACTED_IN"]}.__getitem__
+        record.data.return_value = {"nodes": [{"name": "Person"}], "relationships": [("Person", "ACTED_IN", "Movie")]}
+        mock_session.run.return_value.single.return_value = record
+
+        tools = Neo4jTools("uri", "user", "password", prewarm_schema=True)
+        assert mock_session.run.call_count == 1
+
+        assert tools.list_labels() == ["Person"]
+        assert tools.list_relationship_types() == ["ACTED_IN"]
+        assert tools.get_schema() == {"nodes": [{"name": "Person"}], "relationships": [("Person", "ACTED_IN", "Movie")]}
+        assert mock_session.run.call_count == 1
+        record.data.assert_called_once_with("nodes", "relationships")
+
+
+def test_prewarm_schema_failure_does_not_raise():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.side_effect = Exception("Procedure not found")
+
+        tools = Neo4jTools("uri", "user", "password", prewarm_schema=True)
+        assert tools._schema_cache == {}
+
+
+def test_run_cypher_many():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        people, movies = MagicMock(), MagicMock()
+        people.data.return_value = [{"name": "John"}]
+        movies.data.return_value = [{"title": "Heat"}]
+        mock_session.run.side_effect = [people, Exception("Syntax error"), movies]
+
+        tools = Neo4jTools("uri", "user", "password", enable_run_cypher_many=True)
+        results = tools.run_cypher_many(
+            ["MATCH (p:Person) RETURN p.name AS name", "INVALID", "MATCH (m:Movie) RETURN m.title AS title"]
+        )
+
+        assert results == [[{"name": "John"}], [], [{"title": "Heat"}]]
+        assert mock_driver.return_value.session.call_count == 1
+        assert "run_cypher_many" in [tool.__name__ for tool in tools.tools]
+
+
+def test_run_cypher_many_empty():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        tools = Neo4jTools("uri", "user", "password")
+        assert tools.run_cypher_many([]) == []
+        mock_driver.return_value.session.assert_not_called()
+
+
+def test_run_cypher_many_session_error():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_driver.return_value.session.side_effect = Exception("Connection lost")
+
+        tools = Neo4jTools("uri", "user", "password")
+        assert tools.run_cypher_many(["MATCH (n) RETURN n", "MATCH (m) RETURN m"]) == [[], []]
+        assert "run_cypher_many" not in [tool.__name__ for tool in tools.tools]
+
+
+def test_missing_neo4j_package():
+    with patch.dict(sys.modules, {"neo4j": None}), patch("agno.tools.neo4j.logger") as mock_logger:
+        with pytest.raises(ImportError, match="`neo4j` not installed"):
+            Neo4jTools("uri", "user", "password")
+        # A missing package is not a connection failure
+        mock_logger.error.assert_not_called()
+
+
+def test_neo4j_imported_once_per_construction():
+    with (
+        patch("neo4j.GraphDatabase.driver"),
+        patch("agno.tools.neo4j._import_neo4j", wraps=_import_neo4j) as mock_import,
+    ):
+        Neo4jTools("uri", "user", "password")
+        assert mock_import.call_count == 1
+
+
+def test_run_cypher_query_routes_reads_to_read_sessions():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password")
+        tools.run_cypher_query("MATCH (p:Person) RETURN p.name")
+        mock_driver.return_value.session.assert_called_with(database="neo4j", default_access_mode="READ")
+
+        tools.run_cypher_query("MATCH (p:Person) SET p.seen = true")
+        mock_driver.return_value.session.assert_called_with(database="neo4j")
+
+        tools.run_cypher_many(["MATCH (p:Person) RETURN p.name", "MATCH (m:Movie) RETURN m.title"])
+        mock_driver.return_value.session.assert_called_with(database="neo4j", default_access_mode="READ")
+
+        tools.run_cypher_many(["MATCH (p:Person) RETURN p.name", "CREATE (:Movie)"])
+        mock_driver.return_value.session.assert_called_with(database="neo4j")
+
+        tools.run_cypher_query("INSERT (:Person {name: 'John'})")
+        mock_driver.return_value.session.assert_called_with(database="neo4j")
+
+
+def _access_mode_error():
+    error = Exception("Writing in read access mode not allowed")
+    error.code = "Neo.ClientError.Statement.AccessMode"  # type: ignore[attr-defined]
+    return error
+
+
+def test_run_cypher_query_retries_rejected_reads_in_write_session():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_result = MagicMock()
+        mock_result.data.return_value = [{"count": 1}]
+        mock_session.run.side_effect = [_access_mode_error(), mock_result]
+
+        tools = Neo4jTools("uri", "user", "password", cache_query_results=True)
+        tools._set_cached_schema("labels", ["Person"])
+        result = tools.run_cypher_query("MATCH (n) RETURN count(n) AS count")
+
+        assert result == [{"count": 1}]
+        mock_driver.return_value.session.assert_called_with(database="neo4j")
+        assert tools._query_cache == {}
+        assert tools._get_cached_schema("labels") is None
+
+
+def test_run_cypher_many_retries_rejected_reads_in_write_session():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        people, touched = MagicMock(), MagicMock()
+        people.data.return_value = [{"name": "John"}]
+        touched.data.return_value = [{"count": 1}]
+        mock_session.run.side_effect = [people, _access_mode_error(), touched]
+
+        tools = Neo4jTools("uri", "user", "password")
+        results = tools.run_cypher_many(["MATCH (p:Person) RETURN p.name AS name", "MATCH (n) RETURN count(n)"])
+
+        assert results == [[{"name": "John"}], [{"count": 1}]]
+        assert mock_session.run.call_args_list[-1].args == ("MATCH (n) RETURN count(n)",)
+        mock_driver.return_value.session.assert_called_with(database="neo4j")
+
+
+def test_iter_cypher_query_retries_rejected_reads_in_write_session():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        record = MagicMock()
+        record.data.return_value = {"count": 1}
+        mock_session.run.side_effect = [_access_mode_error(), iter([record])]
+
+        tools = Neo4jTools("uri", "user", "password")
+        assert list(tools.iter_cypher_query("MATCH (n) RETURN count(n)")) == [{"count": 1}]
+        mock_driver.return_value.session.assert_called_with(database="neo4j")
+
+
+def test_iter_cypher_query():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        records = [MagicMock(), MagicMock()]
+        records[0].data.return_value = {"name": "John"}
+        records[1].data.return_value = {"name": "Jane"}
+        mock_session.run.return_value = iter(records)
+
+        tools = Neo4jTools("uri", "user", "password")
+        rows = tools.iter_cypher_query("MATCH (p:Person) RETURN p.name AS name")
+        mock_session.run.assert_not_called()
+
+        assert next(rows) == {"name": "John"}
+        assert not mock_session.__exit__.called
+        assert list(rows) == [{"name": "Jane"}]
+        assert mock_session.__exit__.called
+        assert "iter_cypher_query" not in [tool.__name__ for tool in tools.tools]
+
+
+def test_iter_cypher_query_error():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+        mock_session.run.side_effect = Exception("Cypher query failed")
+
+        tools = Neo4jTools("uri", "user", "password")
+        with pytest.raises(Exception, match="Cypher query failed"):
+            list(tools.iter_cypher_query("INVALID QUERY"))
+
+
+def test_run_cypher_query_pagination():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password")
+        tools.run_cypher_query("MATCH (p:Person) RETURN p.name;", limit=10, skip=20)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p.name SKIP $skip LIMIT $limit", skip=20, limit=10)
+
+        tools.run_cypher_query("MATCH (p:Person) RETURN p.name", limit=5)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p.name LIMIT $limit", limit=5)
+
+        # An explicit trailing LIMIT or SKIP in the query wins
+        tools.run_cypher_query("MATCH (p:Person) RETURN p.name LIMIT 3", limit=5)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p.name LIMIT 3")
+
+        tools.run_cypher_query("MATCH (p:Person) RETURN p.name SKIP 5", skip=10, limit=5)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p.name SKIP 5")
+
+
+def test_run_cypher_query_pagination_with_trailing_comments():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password")
+        tools.run_cypher_query("MATCH (p:Person) RETURN p.name // every person", limit=5)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p.name LIMIT $limit", limit=5)
+
+        # A LIMIT followed by a comment is still the query's own LIMIT
+        tools.run_cypher_query("MATCH (p:Person) RETURN p LIMIT 10 // top ten", limit=5)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p LIMIT 10 // top ten")
+
+        tools.run_cypher_query("MATCH (p:Person) RETURN p SKIP 5 /* past the first page */", skip=10)
+        mock_session.run.assert_called_with("MATCH (p:Person) RETURN p SKIP 5 /* past the first page */")
+
+        # Comment markers inside string literals are not comments
+        tools.run_cypher_query("MATCH (p {url: 'http://example.com'}) RETURN p", limit=5)
+        mock_session.run.assert_called_with("MATCH (p {url: 'http://example.com'}) RETURN p LIMIT $limit", limit=5)
+
+
+def test_run_cypher_query_pagination_requires_final_return():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password")
+        # Procedure calls and writes are still bounded when they end with a RETURN
+        query = "CALL db.index.fulltext.queryNodes('names', 'john') YIELD node RETURN node"
+        tools.run_cypher_query(query, limit=5)
+        mock_session.run.assert_called_with(query + " LIMIT $limit", limit=5)
+
+        tools.run_cypher_query("CREATE (p:Person {name: 'John'}) RETURN p", limit=5)
+        mock_session.run.assert_called_with("CREATE (p:Person {name: 'John'}) RETURN p LIMIT $limit", limit=5)
+
+        tools.run_cypher_query("CALL { MATCH (p:Person) RETURN p } RETURN p.name AS name", limit=5)
+        mock_session.run.assert_called_with(
+            "CALL { MATCH (p:Person) RETURN p } RETURN p.name AS name LIMIT $limit", limit=5
+        )
+
+        for query in (
+            "CREATE (p:Person {name: 'John'})",
+            "CALL { MATCH (p:Person) RETURN p }",
+            "MATCH (p:Person) RETURN p.name AS name UNION MATCH (m:Movie) RETURN m.title AS name",
+        ):
+            tools.run_cypher_query(query, limit=5, skip=10)
+            mock_session.run.assert_called_with(query)
+
+
+def test_run_cypher_query_cache_keys_include_pagination():
+    with patch("neo4j.GraphDatabase.driver") as mock_driver:
+        mock_session = mock_driver.return_value.session.return_value
+        mock_session.__enter__.return_value = mock_session
+
+        tools = Neo4jTools("uri", "user", "password", cache_query_results=True)
+        query = "MATCH (p:Person) RETURN p.name"
+        tools.run_cypher_query(query, limit=10)
+        tools.run_cypher_query(query, limit=10, skip=10)
+        tools.run_cypher_query(query, limit=10)
+        assert mock_session.run.call_count == 2
+
+
+async def test_aget_schema():
+    with patch("neo4j.GraphDatabase.driver"), patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        mock_session = _mock_async_session(mock_async_driver)
+        mock_record = MagicMock()
+        mock_record.data.return_value = {"nodes": [], "relationships": []}
+        mock_session.run.return_value.single = AsyncMock(return_value=mock_record)
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True)
+        assert await tools.aget_schema() == {"nodes": [], "relationships": []}
+
+
+async def test_arun_cypher_many():
+    with patch("neo4j.AsyncGraphDatabase.driver") as mock_async_driver:
+        mock_session = _mock_async_session(mock_async_driver)
+        people = MagicMock()
+        people.data = AsyncMock(return_value=[{"name": "John"}])
+        mock_session.run.side_effect = [people, Exception("Syntax error")]
+
+        tools = Neo4jTools("uri", "user", "password", async_mode=True, enable_run_cypher_many=True)
+        tool_names = [tool.__name__ for tool in tools.tools]
+        assert "arun_cypher_many" in tool_names
+        assert "run_cypher_many" not in tool_names
+
+        results = await tools.arun_cypher_many(["MATCH (p:Person) RETURN p.name AS name", "INVALID"])
+        assert results == [[{"name": "John"}], []]
+        assert mock_async_driver.return_value.session.call_count == 1
+
+        assert await tools.arun_cypher_many([]) == []
+        assert mock_async_driver.return_value.session.call_count == 1